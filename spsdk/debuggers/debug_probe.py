@@ -48,6 +48,8 @@ class DebugProbeNotOpenError(DebugProbeError):
 class DebugProbe():
     """Abstraction class to define SPSDK debug probes interface."""
 
+    __slots__ = ("hardware_id", "user_params", "dbgmlbx_ap_ix")
+
     # Constants to detect the debug mailbox access port
     APBANKSEL = 0x000000f0
     APSEL = 0xff000000
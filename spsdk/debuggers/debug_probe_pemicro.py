@@ -7,7 +7,7 @@
 """Module for DebugMailbox Pemicro Debug probes support."""
 
 import logging
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 
 from pypemicro import PyPemicro, PEMicroException, PEMicroInterfaces
 
@@ -18,19 +18,23 @@ from .debug_probe import (DebugProbe,
                           DebugProbeError)
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.CRITICAL)
 PEMICRO_LOGGER = logger.getChild("PyPemicro")
 
 
 class DebugProbePemicro(DebugProbe):
     """Class to define Pemicro package interface for NXP SPSDK."""
 
+    __slots__ = ("pemicro", "_apsel_shifted", "_ap_scan_max_misses")
+
+    # Count of consecutive missing access ports to stop the debug mailbox access port scan
+    AP_SCAN_MAX_MISSES = 8
+
     @classmethod
     def get_pemicro_lib(cls) -> PyPemicro:
-        """Get J-Link object.
+        """Get Pemicro object.
 
-        :return: The J-Link Object
-        :raises DebugProbeError: The J-Link object get function failed.
+        Each call creates a new object, the object handles just one probe connection.
+        :return: The Pemicro Object
         """
         return PyPemicro(log_info=PEMICRO_LOGGER.info, log_debug=PEMICRO_LOGGER.debug,
                          log_err=PEMICRO_LOGGER.error, log_war=PEMICRO_LOGGER.warn)
@@ -39,12 +43,26 @@ class DebugProbePemicro(DebugProbe):
         """The Pemicro class initialization.
 
         The Pemicro initialization function for SPSDK library to support various DEBUG PROBES.
+        :param hardware_id: Open probe with selected hardware ID
+        :param user_params: The user params dictionary, optional 'ap_scan_max_misses' parameter overrides
+            the count of consecutive missing access ports to stop the debug mailbox access port scan
+        :raises DebugProbeError: Invalid ap_scan_max_misses user parameter
         """
         super().__init__(hardware_id, user_params)
 
         self.pemicro: Optional[PyPemicro] = None
+        # Precomputed APSEL/APBANKSEL part of the debug mailbox access port register address
+        self._apsel_shifted: int = 0
 
-        logger.debug(f"The SPSDK Pemicro Interface has been initialized")
+        max_misses = (self.user_params or {}).get("ap_scan_max_misses", self.AP_SCAN_MAX_MISSES)
+        try:
+            self._ap_scan_max_misses = int(max_misses)
+        except (TypeError, ValueError) as exc:
+            raise DebugProbeError(f"Invalid ap_scan_max_misses parameter value: {max_misses}") from exc
+        if self._ap_scan_max_misses <= 0:
+            raise DebugProbeError(f"The ap_scan_max_misses parameter must be positive, got {max_misses}")
+
+        logger.debug("The SPSDK Pemicro Interface has been initialized")
 
     @classmethod
     def get_connected_probes(cls, hardware_id: str = None, user_params: Dict = None) -> List[ProbeDescription]:
@@ -59,15 +77,13 @@ class DebugProbePemicro(DebugProbe):
         #TODO fix problems with cyclic import
         from .utils import DebugProbes
 
-        pemicro = DebugProbePemicro.get_pemicro_lib()
-
         probes = DebugProbes()
-        connected_probes = pemicro.list_ports()
-        for probe in connected_probes:
-            probes.append(ProbeDescription("PEMicro",
-                                           probe["id"],
-                                           probe["description"],
-                                           DebugProbePemicro))
+        # The listing of ports doesn't need any PyPemicro connection object
+        connected_probes = PyPemicro.list_ports()
+        probes.extend(ProbeDescription("PEMicro",
+                                       probe["id"],
+                                       probe["description"],
+                                       DebugProbePemicro) for probe in connected_probes)
 
         return probes
 
@@ -82,17 +98,13 @@ class DebugProbePemicro(DebugProbe):
         :raises DebugProbeError: The Pemicro cannot establish communication with target
         """
         try:
-            self.pemicro = DebugProbePemicro.get_pemicro_lib()
             if self.pemicro is None:
-                raise DebugProbeError(f"Getting of J-Link library failed.")
-        except DebugProbeError as exc:
-            raise DebugProbeError(f"Getting of J-Link library failed({str(exc)}).")
-        try:
+                self.pemicro = DebugProbePemicro.get_pemicro_lib()
             self.pemicro.open(debug_hardware_name_ip_or_serialnum=self.hardware_id)
             self.pemicro.connect(PEMicroInterfaces.SWD)  # type: ignore
             debugmb_dbgmlbx_ap_ix = self._get_dmbox_ap()
         except PEMicroException as exc:
-            raise DebugProbeError(f"Pemicro cannot establish communication with target({str(exc)}).")
+            raise DebugProbeError(f"Pemicro cannot establish communication with target({str(exc)}).") from exc
 
         if self.dbgmlbx_ap_ix == -1:
             if debugmb_dbgmlbx_ap_ix == -1:
@@ -100,7 +112,23 @@ class DebugProbePemicro(DebugProbe):
             self.dbgmlbx_ap_ix = debugmb_dbgmlbx_ap_ix
         else:
             if debugmb_dbgmlbx_ap_ix != self.dbgmlbx_ap_ix:
-                logger.info(f"The detected debug mailbox accessport index is different to specified.")
+                logger.info("The detected debug mailbox accessport index is different to specified.")
+
+        self._update_apsel_shifted()
+
+    @DebugProbe.debug_mailbox_access_port.setter  # type: ignore
+    def debug_mailbox_access_port(self, value: int) -> None:
+        """Force the debug mailbox access port.
+
+        The base class getter is kept, the setter updates also the precomputed access port address bits.
+        :param value: Forced value of Debug Mailbox Access port.
+        """
+        self.dbgmlbx_ap_ix = value
+        self._update_apsel_shifted()
+
+    def _update_apsel_shifted(self) -> None:
+        """Precompute the APSEL/APBANKSEL address bits of the debug mailbox access port."""
+        self._apsel_shifted = (self.dbgmlbx_ap_ix << self.APSEL_SHIFT) & self.APSEL_APBANKSEL
 
     def close(self) -> None:
         """Close Pemicro interface.
@@ -109,6 +137,7 @@ class DebugProbePemicro(DebugProbe):
         """
         if self.pemicro:
             self.pemicro.close()
+            self.pemicro = None
 
     def dbgmlbx_reg_read(self, addr: int = 0) -> int:
         """Read debug mailbox access port register.
@@ -141,16 +170,16 @@ class DebugProbePemicro(DebugProbe):
         :raises DebugProbeNotOpenError: The Pemicro probe is NOT opened
 
         """
-        if self.pemicro is None:
+        pem = self.pemicro
+        if pem is None:
             raise DebugProbeNotOpenError("The Pemicro debug probe is not opened yet")
 
         try:
             if access_port:
-                addr_ap = addr | ((self.dbgmlbx_ap_ix << self.APSEL_SHIFT) & self.APSEL_APBANKSEL)
-                ret = self.pemicro.read_ap_register(apselect=self.dbgmlbx_ap_ix,
-                                                    addr=addr_ap)
+                addr_ap = addr | self._apsel_shifted
+                ret = pem.read_ap_register(apselect=self.dbgmlbx_ap_ix, addr=addr_ap)
             else:
-                ret = self.pemicro.read_dp_register(addr=addr)
+                ret = pem.read_dp_register(addr=addr)
             return ret
         except PEMicroException as exc:
             raise DebugProbeTransferError(f"The Coresight read operation failed({str(exc)}).")
@@ -165,17 +194,16 @@ class DebugProbePemicro(DebugProbe):
         :raises DebugProbeTransferError: The IO operation failed
         :raises DebugProbeNotOpenError: The Pemicro probe is NOT opened
         """
-        if self.pemicro is None:
+        pem = self.pemicro
+        if pem is None:
             raise DebugProbeNotOpenError("The Pemicro debug probe is not opened yet")
 
         try:
             if access_port:
-                addr_ap = addr | ((self.dbgmlbx_ap_ix << self.APSEL_SHIFT) & self.APSEL_APBANKSEL)
-                self.pemicro.write_ap_register(apselect=self.dbgmlbx_ap_ix,
-                                               addr=addr_ap,
-                                               value=data)
+                addr_ap = addr | self._apsel_shifted
+                pem.write_ap_register(apselect=self.dbgmlbx_ap_ix, addr=addr_ap, value=data)
             else:
-                self.pemicro.write_dp_register(addr=addr, value=data)
+                pem.write_dp_register(addr=addr, value=data)
 
         except PEMicroException as exc:
             raise DebugProbeTransferError(f"The Coresight write operation failed({str(exc)}).")
@@ -193,22 +221,50 @@ class DebugProbePemicro(DebugProbe):
         if self.pemicro is None:
             raise DebugProbeNotOpenError("The Pemicro debug probe is not opened yet")
 
-        logger.debug(f"Looking for debug mailbox access port")
+        logger.debug("Looking for debug mailbox access port")
+
+        # Check the forced/previously detected access port first
+        scan_order = list(range(256))
+        if 0 <= self.dbgmlbx_ap_ix < 256:
+            scan_order.remove(self.dbgmlbx_ap_ix)
+            scan_order.insert(0, self.dbgmlbx_ap_ix)
+
+        apsel_shift = self.APSEL_SHIFT
+        apsel_mask = self.APSEL_APBANKSEL
+        apsel_addr_pairs = ((access_port_ix, idr_address | ((access_port_ix << apsel_shift) & apsel_mask))
+                            for access_port_ix in scan_order)
+
+        misses_in_row = 0
+        for access_port_ix, ret in self._read_ap_registers(self.pemicro, apsel_addr_pairs):
+            if ret == idr_expected:
+                logger.debug("Found debug mailbox ix:%d", access_port_ix)
+                return access_port_ix
+            if ret:
+                logger.debug("Found general access port ix:%d", access_port_ix)
+                misses_in_row = 0
+            else:
+                logger.debug("The AP(%d) is not available", access_port_ix)
+                misses_in_row += 1
+                if misses_in_row >= self._ap_scan_max_misses:
+                    logger.debug("Stopping the access port scan after %d missing APs in row", misses_in_row)
+                    break
+
+        return -1
+
+    @staticmethod
+    def _read_ap_registers(pemicro: PyPemicro,
+                           apsel_addr_pairs: Iterable[Tuple[int, int]]) -> Iterator[Tuple[int, Optional[int]]]:
+        """Read a sequence of access port registers one by one.
 
-        for access_port_ix in range(256):
+        The reads are issued lazily, the caller may stop the iteration to skip the remaining reads.
+        The failure of one read doesn't abort the whole sequence.
+        :param pemicro: The opened Pemicro object
+        :param apsel_addr_pairs: Iterable of (access port index, register address) tuples
+        :return: Iterator of (access port index, read value) tuples, the value is None for the reads that failed
+        """
+        read_ap = pemicro.read_ap_register
+        for apsel, addr in apsel_addr_pairs:
             try:
-                address = idr_address | ((access_port_ix << self.APSEL_SHIFT) & self.APSEL_APBANKSEL)
-                ret = self.pemicro.read_ap_register(apselect=access_port_ix,
-                                                    addr=address)
-
-                if ret == idr_expected:
-                    logger.debug(f"Found debug mailbox ix:{access_port_ix}")
-                    return access_port_ix
-                if ret != 0:
-                    logger.debug(f"Found general access port ix:{access_port_ix}")
-                else:
-                    logger.debug(f"The AP({access_port_ix}) is not available")
+                yield apsel, read_ap(apselect=apsel, addr=addr)
             except PEMicroException:
-                logger.debug(f"The AP({access_port_ix}) is not available")
-
-        return -1
+                yield apsel, None
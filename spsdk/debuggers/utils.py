@@ -36,6 +36,18 @@ class DebugProbes(list):
         else:
             raise ValueError('The list accepts only ProbeDescription object')
 
+    def extend(self, items: Iterable[ProbeDescription]) -> None:
+        """Overriding build-in function by check the type.
+
+        :param items: Iterable of ProbeDestription items.
+        :raises ValueError: Invalid input types has been used.
+        """
+        items = list(items)
+        if all(isinstance(item, ProbeDescription) for item in items):
+            super(DebugProbes, self).extend(items)
+        else:
+            raise ValueError('The list accepts only ProbeDescription object')
+
     def insert(self, index: int, item: ProbeDescription) -> None:
         """Overriding build-in function by check the type.
 
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2020 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests of the general debug probe."""
+
+from spsdk.debuggers.debug_probe_jlink import DebugProbePyLink
+from spsdk.debuggers.debug_probe_pyocd import DebugProbePyOCD
+
+
+def test_debug_probe_subclass_attributes():
+    """Test the debug probe classes without slots keep their own attributes."""
+    probe = DebugProbePyLink("1234", {"param": "value"})
+    assert probe.hardware_id == "1234"
+    assert probe.user_params == {"param": "value"}
+    assert probe.use_coresight_rw
+    probe.use_coresight_rw = False
+    assert not probe.use_coresight_rw
+
+    probe = DebugProbePyOCD("1234")
+    probe.debug_mailbox_access_port = 2
+    assert probe.debug_mailbox_access_port == 2
+    assert probe.pyocd_session is None
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2020 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests of the Pemicro debug probe."""
+
+from unittest.mock import patch
+
+import pytest
+from pypemicro import PEMicroException
+
+from spsdk.debuggers.debug_probe import DebugProbeError
+from spsdk.debuggers.debug_probe_pemicro import DebugProbePemicro
+
+DMBOX_IDR = 0x002A0000
+GENERAL_AP_IDR = 0x24770011
+
+
+class PemicroProxy:
+    """Simple replacement of PyPemicro connection simulating the access ports of the target."""
+
+    def __init__(self, ap_idrs: dict) -> None:
+        self.ap_idrs = ap_idrs
+        self.hardware_id = None
+        self.ap_reads = []
+        self.ap_registers = {}
+
+    def open(self, debug_hardware_name_ip_or_serialnum: str) -> None:
+        self.hardware_id = debug_hardware_name_ip_or_serialnum
+
+    def connect(self, interface) -> None:
+        pass
+
+    def close(self) -> None:
+        self.hardware_id = None
+
+    def read_ap_register(self, apselect: int, addr: int) -> int:
+        self.ap_reads.append(apselect)
+        if apselect not in self.ap_idrs:
+            raise PEMicroException(f"The AP({apselect}) doesn't exist")
+        if addr & 0xFF == 0xFC:
+            return self.ap_idrs[apselect]
+        return self.ap_registers.get((apselect, addr), 0)
+
+    def write_ap_register(self, apselect: int, addr: int, value: int) -> None:
+        self.ap_registers[(apselect, addr)] = value
+
+
+def open_probe(ap_idrs: dict, user_params: dict = None, forced_ap: int = None) -> tuple:
+    """Open the Pemicro debug probe connected to the simulated target."""
+    pemicro = PemicroProxy(ap_idrs)
+    probe = DebugProbePemicro("SIM", user_params)
+    if forced_ap is not None:
+        probe.debug_mailbox_access_port = forced_ap
+    with patch("spsdk.debuggers.debug_probe_pemicro.PyPemicro", lambda **kwargs: pemicro):
+        probe.open()
+    return probe, pemicro
+
+
+def test_dmbox_ap_found():
+    """Test the scan stops on the debug mailbox access port."""
+    probe, pemicro = open_probe({0: GENERAL_AP_IDR, 1: GENERAL_AP_IDR, 2: DMBOX_IDR, 3: GENERAL_AP_IDR})
+    assert probe.debug_mailbox_access_port == 2
+    assert pemicro.ap_reads == [0, 1, 2]
+    assert pemicro.hardware_id == "SIM"
+
+
+def test_dmbox_ap_forced_checked_first():
+    """Test the forced debug mailbox access port is checked before the scan."""
+    probe, pemicro = open_probe({0: GENERAL_AP_IDR, 5: DMBOX_IDR}, forced_ap=5)
+    assert probe.debug_mailbox_access_port == 5
+    assert pemicro.ap_reads == [5]
+
+
+def test_dmbox_ap_scan_early_stop():
+    """Test the scan stops after the default count of missing access ports in row."""
+    pemicro = PemicroProxy({0: GENERAL_AP_IDR, 1: 0})
+    probe = DebugProbePemicro("SIM")
+    probe.pemicro = pemicro
+    assert probe._get_dmbox_ap() == -1
+    assert pemicro.ap_reads == list(range(1 + DebugProbePemicro.AP_SCAN_MAX_MISSES))
+
+
+def test_dmbox_ap_scan_max_misses_string():
+    """Test the ap_scan_max_misses user parameter given as a string (command line)."""
+    pemicro = PemicroProxy({})
+    probe = DebugProbePemicro("SIM", {"ap_scan_max_misses": "4"})
+    probe.pemicro = pemicro
+    assert probe._get_dmbox_ap() == -1
+    assert pemicro.ap_reads == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-1", None])
+def test_dmbox_ap_scan_max_misses_invalid(value):
+    """Test invalid ap_scan_max_misses user parameter is refused before any probe access."""
+    with patch("spsdk.debuggers.debug_probe_pemicro.PyPemicro") as pemicro_cls:
+        with pytest.raises(DebugProbeError):
+            DebugProbePemicro("SIM", {"ap_scan_max_misses": value})
+    pemicro_cls.assert_not_called()
+
+
+def test_probes_own_connections():
+    """Test each opened probe uses and closes its own Pemicro connection."""
+    with patch("spsdk.debuggers.debug_probe_pemicro.PyPemicro", lambda **kwargs: PemicroProxy({0: DMBOX_IDR})):
+        probe_a = DebugProbePemicro("A")
+        probe_b = DebugProbePemicro("B")
+        probe_a.open()
+        probe_b.open()
+    pemicro_a, pemicro_b = probe_a.pemicro, probe_b.pemicro
+    assert pemicro_a is not pemicro_b
+    assert pemicro_a.hardware_id == "A"
+    assert pemicro_b.hardware_id == "B"
+
+    probe_a.close()
+    assert probe_a.pemicro is None
+    assert pemicro_a.hardware_id is None
+    assert pemicro_b.hardware_id == "B"
+    probe_b.close()
+    assert pemicro_b.hardware_id is None
+
+
+def test_dmbox_register_access():
+    """Test the debug mailbox register access of the opened probe, which has no instance dictionary."""
+    probe, pemicro = open_probe({0: GENERAL_AP_IDR, 2: DMBOX_IDR})
+    assert not hasattr(probe, "__dict__")
+
+    probe.dbgmlbx_reg_write(addr=0x04, data=0x1234)
+    assert pemicro.ap_registers == {(2, 0x02000004): 0x1234}
+    assert probe.dbgmlbx_reg_read(addr=0x04) == 0x1234
+
+    probe.debug_mailbox_access_port = 0
+    probe.dbgmlbx_reg_write(addr=0x04, data=0x5678)
+    assert pemicro.ap_registers[(0, 0x04)] == 0x5678
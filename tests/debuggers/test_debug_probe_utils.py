@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2020 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests of the debug probe utilities."""
+
+from unittest.mock import patch
+
+import pytest
+
+from spsdk.debuggers.debug_probe import ProbeDescription
+from spsdk.debuggers.debug_probe_pemicro import DebugProbePemicro
+from spsdk.debuggers.utils import DebugProbes
+
+
+def test_debug_probes_extend():
+    """Test extending of the probe list by ProbeDescription items."""
+    probes = DebugProbes()
+    probes.extend(ProbeDescription("PEMicro", str(ix), f"Probe {ix}", DebugProbePemicro) for ix in range(3))
+    assert [probe.hardware_id for probe in probes] == ["0", "1", "2"]
+
+
+def test_debug_probes_extend_invalid():
+    """Test the probe list stays unchanged when extended by a non ProbeDescription item."""
+    probes = DebugProbes()
+    probes.append(ProbeDescription("PEMicro", "0", "Probe 0", DebugProbePemicro))
+    with pytest.raises(ValueError):
+        probes.extend([ProbeDescription("PEMicro", "1", "Probe 1", DebugProbePemicro), "Probe 2"])
+    assert len(probes) == 1
+    assert probes[0].hardware_id == "0"
+
+
+def test_pemicro_get_connected_probes():
+    """Test listing of the connected Pemicro probes."""
+    ports = [
+        {"id": "USB1", "description": "Multilink Universal FX Rev C (PEMFX1)"},
+        {"id": "USB2", "description": "Cyclone FX (CYCFX2)"},
+    ]
+    with patch("spsdk.debuggers.debug_probe_pemicro.PyPemicro.list_ports", return_value=ports):
+        probes = DebugProbePemicro.get_connected_probes()
+
+    assert isinstance(probes, DebugProbes)
+    assert [(probe.interface, probe.hardware_id, probe.description, probe.probe) for probe in probes] == [
+        ("PEMicro", "USB1", "Multilink Universal FX Rev C (PEMFX1)", DebugProbePemicro),
+        ("PEMicro", "USB2", "Cyclone FX (CYCFX2)", DebugProbePemicro),
+    ]